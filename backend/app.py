@@ -1,18 +1,31 @@
+import asyncio
+import ipaddress
 import logging
 import os
 import re
 import time
-from typing import Any, Dict, List, Optional
+import uuid
+from collections import deque
+from contextlib import asynccontextmanager
+from functools import lru_cache
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
 
 import httpx
+import orjson
+from cachetools import TTLCache
 from fastapi import FastAPI, HTTPException, Query
-from fastapi import Request
+from fastapi import Request, Response
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel, ConfigDict
 try:
     from dotenv import load_dotenv
 except ModuleNotFoundError:
     load_dotenv = None
+try:
+    import redis.asyncio as redis_asyncio
+except ModuleNotFoundError:
+    redis_asyncio = None
 
 if load_dotenv:
     load_dotenv()
@@ -22,7 +35,15 @@ NOTION_DATABASE_ID = os.getenv("NOTION_DATABASE_ID")
 GOOGLE_BOOKS_API_KEY = os.getenv("GOOGLE_BOOKS_API_KEY")
 API_KEY = os.getenv("API_KEY")
 RATE_LIMIT_PER_MIN = int(os.getenv("RATE_LIMIT_PER_MIN", "60"))
+RATE_LIMIT_SWEEP_SECONDS = 60
+REDIS_URL = os.getenv("REDIS_URL")
 NOTION_AUTHOR_DB_ID = os.getenv("NOTION_AUTHOR_DB_ID")
+HTTPX_MAX_CONN = int(os.getenv("HTTPX_MAX_CONN", "200"))
+HTTPX_MAX_KEEPALIVE = int(os.getenv("HTTPX_MAX_KEEPALIVE", "50"))
+HTTPX_KEEPALIVE_EXPIRY = 30
+NOTION_CONCURRENCY = int(os.getenv("NOTION_CONCURRENCY", "3"))
+NOTION_MAX_RETRIES = 3
+NOTION_MAX_RETRY_DELAY = 5.0
 
 AUTHOR_RELATION_PROPERTY_NAME = "Author"
 
@@ -32,7 +53,54 @@ NOTION_PAGES_URL = "https://api.notion.com/v1/pages"
 NOTION_DATABASE_QUERY_URL = "https://api.notion.com/v1/databases/{database_id}/query"
 NOTION_DATABASE_URL = "https://api.notion.com/v1/databases/{database_id}"
 
-app = FastAPI(title="Notion Book Tracker")
+# YYYY, YYYY-MM or YYYY-MM-DD; groups 2 and 3 tell which form matched.
+_DATE_RE = re.compile(r"(\d{4})(?:-(\d{2})(?:-(\d{2}))?)?")
+
+# Sliding-window limiter shared across workers: trim hits older than the window,
+# reject if the key is at the limit, otherwise record this hit.
+RATE_LIMIT_LUA = """
+redis.call('ZREMRANGEBYSCORE', KEYS[1], 0, ARGV[1])
+local n = redis.call('ZCARD', KEYS[1])
+if n >= tonumber(ARGV[3]) then
+    return 0
+end
+redis.call('ZADD', KEYS[1], ARGV[2], ARGV[4])
+redis.call('EXPIRE', KEYS[1], 60)
+return 1
+"""
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Each /add fans out to several Notion calls, so the pool is sized well above
+    # httpx's defaults; idle sockets are recycled after 30s to avoid stale connections.
+    # api.notion.com and googleapis.com both speak HTTP/2, so one pooled connection
+    # multiplexes many concurrent streams instead of queueing on HTTP/1.1 keepalive.
+    limits = httpx.Limits(
+        max_connections=HTTPX_MAX_CONN,
+        max_keepalive_connections=HTTPX_MAX_KEEPALIVE,
+        keepalive_expiry=HTTPX_KEEPALIVE_EXPIRY,
+    )
+    app.state.http = httpx.AsyncClient(timeout=10, limits=limits, http2=True)
+    app.state.redis = None
+    app.state.rate_limit_script = None
+    if REDIS_URL:
+        if redis_asyncio:
+            app.state.redis = redis_asyncio.from_url(REDIS_URL)
+            app.state.rate_limit_script = app.state.redis.register_script(RATE_LIMIT_LUA)
+        else:
+            logger.warning("REDIS_URL is set but redis is not installed; using in-process rate limiting.")
+    sweeper = asyncio.create_task(_sweep_rate_bucket())
+    try:
+        yield
+    finally:
+        sweeper.cancel()
+        await app.state.http.aclose()
+        if app.state.redis is not None:
+            await app.state.redis.aclose()
+
+
+app = FastAPI(title="Notion Book Tracker", lifespan=lifespan, default_response_class=ORJSONResponse)
 
 logger = logging.getLogger("notion_book_tracker")
 logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
@@ -47,6 +115,8 @@ app.add_middleware(
 
 
 class AddBookPayload(BaseModel):
+    model_config = ConfigDict(extra="ignore", str_strip_whitespace=True)
+
     title: str
     authors: List[str] = []
     isbn: Optional[str] = None
@@ -61,9 +131,18 @@ class AddBookPayload(BaseModel):
     notes: Optional[str] = None
 
 
-_rate_bucket: Dict[str, List[float]] = {}
-_database_title_prop_cache: Dict[str, str] = {}
-_database_schema_cache: Dict[str, Dict[str, str]] = {}
+_rate_bucket: Dict[int, deque] = {}
+# Database metadata expires after 10 minutes so schema edits in Notion are picked up.
+_database_meta_cache: TTLCache = TTLCache(maxsize=64, ttl=600)
+_author_id_cache: TTLCache = TTLCache(maxsize=10000, ttl=3600)
+# In-flight fetches keyed like their caches; entries are dropped as soon as the fetch finishes.
+_database_meta_inflight: Dict[str, asyncio.Future] = {}
+_author_id_inflight: Dict[Tuple[Optional[str], str], asyncio.Future] = {}
+_search_cache: TTLCache = TTLCache(maxsize=2048, ttl=600)
+# Health checks are polled constantly; serve prebuilt bytes instead of serializing a dict each time.
+_HEALTH_RESPONSE = Response(content=b'{"status":"ok"}', media_type="application/json")
+# Notion allows ~3 requests/s per integration; cap in-flight calls so fan-outs don't trip 429s.
+_notion_sem = asyncio.Semaphore(max(1, NOTION_CONCURRENCY))
 
 
 def _notion_headers() -> Dict[str, str]:
@@ -82,96 +161,153 @@ def _notion_database_url(database_id: str) -> str:
     return NOTION_DATABASE_URL.format(database_id=database_id)
 
 
-async def _get_database_title_property_name(client: httpx.AsyncClient, database_id: str) -> Optional[str]:
-    cached = _database_title_prop_cache.get(database_id)
-    if cached:
-        return cached
-
-    response = await client.get(_notion_database_url(database_id), headers=_notion_headers())
-    if response.status_code >= 400:
-        logger.warning("Database fetch error: %s %s", response.status_code, response.text)
+def _retry_after_seconds(response: httpx.Response, attempt: int) -> Optional[float]:
+    retry_after = response.headers.get("retry-after")
+    try:
+        delay = max(0.0, float(retry_after))
+    except (TypeError, ValueError):
+        return 0.5 * 2 ** attempt
+    # Waits longer than the cap would outlast the caller's request timeout; give up instead.
+    if delay > NOTION_MAX_RETRY_DELAY:
         return None
-
-    properties = (response.json() or {}).get("properties", {}) or {}
-    for prop_name, prop in properties.items():
-        if (prop or {}).get("type") == "title":
-            _database_title_prop_cache[database_id] = prop_name
-            return prop_name
-    return None
-
-
-async def _get_database_schema(client: httpx.AsyncClient, database_id: str) -> Dict[str, str]:
-    cached = _database_schema_cache.get(database_id)
+    return delay
+
+
+async def _notion_request(client: httpx.AsyncClient, method: str, url: str, **kwargs: Any) -> httpx.Response:
+    attempt = 0
+    while True:
+        async with _notion_sem:
+            response = await client.request(method, url, **kwargs)
+        logger.debug("Notion %s %s -> %s (%s)", method, url, response.status_code, response.http_version)
+        if response.status_code != 429 or attempt >= NOTION_MAX_RETRIES:
+            return response
+        delay = _retry_after_seconds(response, attempt)
+        if delay is None:
+            logger.warning("Notion asked to retry after %ss; not waiting", response.headers.get("retry-after"))
+            return response
+        logger.info("Notion rate limited; retrying in %.1fs", delay)
+        await asyncio.sleep(delay)
+        attempt += 1
+
+
+def _single_flight(
+    inflight: Dict[Any, asyncio.Future],
+    key: Any,
+    factory: Callable[[], Awaitable[Any]],
+) -> Awaitable[Any]:
+    # Concurrent callers for the same key share one task and therefore its result or
+    # exception; the entry is removed on completion so failures are retried next time.
+    task = inflight.get(key)
+    if task is None:
+        task = asyncio.ensure_future(factory())
+        inflight[key] = task
+
+        def _done(finished: asyncio.Future) -> None:
+            if inflight.get(key) is finished:
+                del inflight[key]
+            if not finished.cancelled():
+                finished.exception()
+
+        task.add_done_callback(_done)
+    # Shield so one caller disconnecting doesn't cancel the fetch for the others.
+    return asyncio.shield(task)
+
+
+async def _get_database_meta(client: httpx.AsyncClient, database_id: str) -> Tuple[Dict[str, str], Optional[str]]:
+    cached = _database_meta_cache.get(database_id)
     if cached is not None:
         return cached
+    return await _single_flight(
+        _database_meta_inflight, database_id, lambda: _fetch_database_meta(client, database_id)
+    )
 
-    response = await client.get(_notion_database_url(database_id), headers=_notion_headers())
+
+async def _fetch_database_meta(client: httpx.AsyncClient, database_id: str) -> Tuple[Dict[str, str], Optional[str]]:
+    response = await _notion_request(client, "GET", _notion_database_url(database_id), headers=_notion_headers())
     if response.status_code >= 400:
         logger.warning("Database fetch error: %s %s", response.status_code, response.text)
-        _database_schema_cache[database_id] = {}
-        return {}
+        return {}, None
 
-    properties = (response.json() or {}).get("properties", {}) or {}
-    schema = {prop_name: (prop or {}).get("type", "") for prop_name, prop in properties.items()}
-    _database_schema_cache[database_id] = schema
-    return schema
+    data = orjson.loads(response.content) or {}
+    properties = data.get("properties") or {}
+    schema: Dict[str, str] = {}
+    title_prop: Optional[str] = None
+    for prop_name, prop in properties.items():
+        prop_type = (prop or {}).get("type", "")
+        schema[prop_name] = prop_type
+        if prop_type == "title" and title_prop is None:
+            title_prop = prop_name
+    _database_meta_cache[database_id] = (schema, title_prop)
+    return schema, title_prop
 
 
-def _set_rich_text(properties: Dict[str, Any], schema: Dict[str, str], name: str, value: Optional[str]) -> None:
+def _set_rich_text(properties: Dict[str, Any], name: str, value: Optional[str]) -> None:
     if not value:
         return
-    if schema.get(name) != "rich_text":
-        return
     properties[name] = {"rich_text": [{"text": {"content": value}}]}
 
 
 def _to_notion_date_start(value: str) -> Optional[str]:
     value = value.strip()
-    if re.fullmatch(r"\d{4}", value):
+    match = _DATE_RE.fullmatch(value)
+    if not match:
+        return None
+    if match.group(2) is None:
         return f"{value}-01-01"
-    if re.fullmatch(r"\d{4}-\d{2}", value):
+    if match.group(3) is None:
         return f"{value}-01"
-    if re.fullmatch(r"\d{4}-\d{2}-\d{2}", value):
-        return value
-    return None
+    return value
 
 
-def _set_date(properties: Dict[str, Any], schema: Dict[str, str], name: str, value: Optional[str]) -> None:
+def _set_date(properties: Dict[str, Any], name: str, value: Optional[str]) -> None:
     if not value:
         return
-    if schema.get(name) != "date":
-        return
     start = _to_notion_date_start(value)
     if not start:
         return
     properties[name] = {"date": {"start": start}}
 
 
-def _set_url(properties: Dict[str, Any], schema: Dict[str, str], name: str, value: Optional[str]) -> None:
+def _set_url(properties: Dict[str, Any], name: str, value: Optional[str]) -> None:
     if not value:
         return
-    if schema.get(name) != "url":
-        return
     properties[name] = {"url": value}
 
 
-def _set_multi_select(properties: Dict[str, Any], schema: Dict[str, str], name: str, values: List[str]) -> None:
+def _set_multi_select(properties: Dict[str, Any], name: str, values: List[str]) -> None:
     values = [v for v in values if v]
     if not values:
         return
-    if schema.get(name) != "multi_select":
-        return
     properties[name] = {"multi_select": [{"name": v} for v in values]}
 
 
-def _set_number(properties: Dict[str, Any], schema: Dict[str, str], name: str, value: Optional[int]) -> None:
+def _set_number(properties: Dict[str, Any], name: str, value: Optional[int]) -> None:
     if value is None:
         return
-    if schema.get(name) != "number":
-        return
     properties[name] = {"number": value}
 
 
+_PROPERTY_SETTERS = {
+    "rich_text": _set_rich_text,
+    "date": _set_date,
+    "url": _set_url,
+    "multi_select": _set_multi_select,
+    "number": _set_number,
+}
+
+# Property types each book field may be written as; anything else in the schema is left alone.
+_BOOK_PROPERTY_TYPES: Dict[str, Tuple[str, ...]] = {
+    "Summary": ("rich_text",),
+    "Genre": ("rich_text",),
+    "Tropes": ("multi_select",),
+    "Publication Date": ("date", "rich_text"),
+    "ISBN": ("rich_text",),
+    "Google Books ID": ("rich_text",),
+    "Publisher": ("rich_text",),
+    "Total Pages": ("number",),
+}
+
+
 def _require_api_key(request: Request) -> None:
     if not API_KEY:
         return
@@ -180,20 +316,58 @@ def _require_api_key(request: Request) -> None:
         raise HTTPException(status_code=401, detail="Invalid API key")
 
 
-def _rate_limit(request: Request) -> None:
+@lru_cache(maxsize=4096)
+def _ip_key(ip: str) -> int:
+    try:
+        return int(ipaddress.ip_address(ip))
+    except ValueError:
+        return -1
+
+
+async def _rate_limit(request: Request) -> None:
     if RATE_LIMIT_PER_MIN <= 0:
         return
     ip = request.client.host if request.client else "unknown"
     now = time.time()
     window_start = now - 60
-    hits = _rate_bucket.setdefault(ip, [])
+
+    script = request.app.state.rate_limit_script
+    if script is not None:
+        try:
+            allowed = await script(
+                keys=[f"rl:{ip}"],
+                args=[window_start, now, RATE_LIMIT_PER_MIN, f"{now}:{uuid.uuid4().hex}"],
+            )
+        except redis_asyncio.RedisError as exc:
+            logger.warning("Redis rate limit error, falling back to in-process limiter: %s", exc)
+        else:
+            if not allowed:
+                raise HTTPException(status_code=429, detail="Rate limit exceeded")
+            return
+
+    key = _ip_key(ip)
+    hits = _rate_bucket.get(key)
+    if hits is None:
+        hits = _rate_bucket[key] = deque()
     while hits and hits[0] < window_start:
-        hits.pop(0)
+        hits.popleft()
     if len(hits) >= RATE_LIMIT_PER_MIN:
         raise HTTPException(status_code=429, detail="Rate limit exceeded")
     hits.append(now)
 
 
+async def _sweep_rate_bucket() -> None:
+    while True:
+        await asyncio.sleep(RATE_LIMIT_SWEEP_SECONDS)
+        window_start = time.time() - 60
+        for key in [key for key, hits in _rate_bucket.items() if not hits or hits[-1] < window_start]:
+            del _rate_bucket[key]
+
+
+# Shared read-only fallback for missing Google Books sub-objects; never mutate it.
+_EMPTY: Dict[str, Any] = {}
+
+
 def _best_isbn(identifiers: List[Dict[str, str]]) -> Optional[str]:
     if not identifiers:
         return None
@@ -205,12 +379,12 @@ def _best_isbn(identifiers: List[Dict[str, str]]) -> Optional[str]:
 
 
 def _normalize_google_book(item: Dict[str, Any]) -> Dict[str, Any]:
-    info = item.get("volumeInfo", {})
-    identifiers = info.get("industryIdentifiers", []) or []
-    image_links = info.get("imageLinks", {}) or {}
+    info = item.get("volumeInfo") or _EMPTY
+    identifiers = info.get("industryIdentifiers") or []
+    image_links = info.get("imageLinks") or _EMPTY
     thumbnail = image_links.get("thumbnail") or image_links.get("smallThumbnail")
-    if thumbnail:
-        thumbnail = thumbnail.replace("http://", "https://")
+    if thumbnail and thumbnail.startswith("http://"):
+        thumbnail = f"https://{thumbnail[7:]}"
 
     return {
         "google_books_id": item.get("id"),
@@ -234,21 +408,27 @@ def _notion_cover(url: str) -> Dict[str, Any]:
 def _build_book_page_payload(payload: AddBookPayload, schema: Dict[str, str], title_prop: str) -> Dict[str, Any]:
     properties: Dict[str, Any] = {title_prop: {"title": [{"text": {"content": payload.title}}]}}
 
-    description = payload.description
-    if description:
-        description = description.strip()
-        if len(description) > 1800:
-            description = f"{description[:1797]}..."
-
-    _set_rich_text(properties, schema, "Summary", description)
-    _set_rich_text(properties, schema, "Genre", payload.mainCategory)
-    _set_multi_select(properties, schema, "Tropes", payload.categories)
-    _set_date(properties, schema, "Publication Date", payload.published)
-    _set_rich_text(properties, schema, "Publication Date", payload.published)
-    _set_rich_text(properties, schema, "ISBN", payload.isbn)
-    _set_rich_text(properties, schema, "Google Books ID", payload.google_books_id)
-    _set_rich_text(properties, schema, "Publisher", payload.publisher)
-    _set_number(properties, schema, "Total Pages", payload.page_count)
+    if schema:
+        description = payload.description
+        if description:
+            description = description.strip()
+            if len(description) > 1800:
+                description = f"{description[:1797]}..."
+
+        values: Dict[str, Any] = {
+            "Summary": description,
+            "Genre": payload.mainCategory,
+            "Tropes": payload.categories,
+            "Publication Date": payload.published,
+            "ISBN": payload.isbn,
+            "Google Books ID": payload.google_books_id,
+            "Publisher": payload.publisher,
+            "Total Pages": payload.page_count,
+        }
+        for name, value in values.items():
+            prop_type = schema.get(name)
+            if prop_type in _BOOK_PROPERTY_TYPES[name]:
+                _PROPERTY_SETTERS[prop_type](properties, name, value)
 
     page_payload: Dict[str, Any] = {"properties": properties}
     if payload.cover_url:
@@ -256,113 +436,157 @@ def _build_book_page_payload(payload: AddBookPayload, schema: Dict[str, str], ti
     return page_payload
 
 
-async def _attach_author_relations(
-    client: httpx.AsyncClient,
-    properties: Dict[str, Any],
-    authors: List[str],
-) -> None:
-    if not NOTION_AUTHOR_DB_ID or not authors:
-        return
-    author_ids = await _get_or_create_author_ids(client, authors)
+def _attach_author_relations(properties: Dict[str, Any], author_ids: List[str]) -> None:
     if author_ids:
         properties[AUTHOR_RELATION_PROPERTY_NAME] = {
             "relation": [{"id": author_id} for author_id in author_ids]
         }
 
 
-async def _get_or_create_author_ids(client: httpx.AsyncClient, authors: List[str]) -> List[str]:
-    if not NOTION_AUTHOR_DB_ID or not authors:
-        return []
-
-    headers = _notion_headers()
-
-    author_ids: List[str] = []
-    title_prop = await _get_database_title_property_name(client, NOTION_AUTHOR_DB_ID)
-    if not title_prop:
-        logger.warning("Could not resolve author title property name; skipping author linking.")
-        return []
+async def _resolve_author_id(
+    client: httpx.AsyncClient,
+    headers: Dict[str, str],
+    title_prop: str,
+    name: str,
+) -> Optional[str]:
+    cache_key = (NOTION_AUTHOR_DB_ID, name)
+    cached = _author_id_cache.get(cache_key)
+    if cached:
+        return cached
+    # Share one query-and-create per author so concurrent /add calls for the same new
+    # author neither duplicate the lookup nor create the page twice.
+    return await _single_flight(
+        _author_id_inflight, cache_key, lambda: _fetch_author_id(client, headers, title_prop, name)
+    )
 
-    for name in authors:
-        query_payload = {
-            "filter": {
-                "property": title_prop,
-                "title": {"equals": name},
-            }
-        }
-        query_url = _notion_query_url(NOTION_AUTHOR_DB_ID)
-        query_response = await client.post(query_url, json=query_payload, headers=headers)
-        if query_response.status_code >= 400:
-            logger.warning("Author query error: %s %s", query_response.status_code, query_response.text)
-            continue
 
-        results = query_response.json().get("results", [])
-        if results:
-            author_ids.append(results[0]["id"])
-            continue
+async def _fetch_author_id(
+    client: httpx.AsyncClient,
+    headers: Dict[str, str],
+    title_prop: str,
+    name: str,
+) -> Optional[str]:
+    query_payload = {"filter": {"property": title_prop, "title": {"equals": name}}}
+    query_url = _notion_query_url(NOTION_AUTHOR_DB_ID)
+    query_response = await _notion_request(
+        client, "POST", query_url, content=orjson.dumps(query_payload), headers=headers
+    )
+    if query_response.status_code >= 400:
+        logger.warning("Author query error: %s %s", query_response.status_code, query_response.text)
+        return None
 
+    results = orjson.loads(query_response.content).get("results", [])
+    if results:
+        author_id = results[0]["id"]
+    else:
         create_payload = {
             "parent": {"database_id": NOTION_AUTHOR_DB_ID},
             "properties": {
                 title_prop: {"title": [{"text": {"content": name}}]}
             },
         }
-        create_response = await client.post(NOTION_PAGES_URL, json=create_payload, headers=headers)
+        create_response = await _notion_request(
+            client, "POST", NOTION_PAGES_URL, content=orjson.dumps(create_payload), headers=headers
+        )
         if create_response.status_code >= 400:
             logger.warning("Author create error: %s %s", create_response.status_code, create_response.text)
-            continue
-        author_ids.append(create_response.json().get("id"))
+            return None
+        author_id = orjson.loads(create_response.content).get("id")
 
+    if author_id:
+        _author_id_cache[(NOTION_AUTHOR_DB_ID, name)] = author_id
+    return author_id
+
+
+async def _get_or_create_author_ids(client: httpx.AsyncClient, authors: List[str]) -> List[str]:
+    if not NOTION_AUTHOR_DB_ID or not authors:
+        return []
+
+    headers = _notion_headers()
+
+    _, title_prop = await _get_database_meta(client, NOTION_AUTHOR_DB_ID)
+    if not title_prop:
+        logger.warning("Could not resolve author title property name; skipping author linking.")
+        return []
+
+    # Resolve every author concurrently; gather keeps the input order for the relation.
+    names = list(dict.fromkeys(authors))
+    resolved = await asyncio.gather(
+        *(_resolve_author_id(client, headers, title_prop, name) for name in names),
+        return_exceptions=True,
+    )
+
+    author_ids: List[str] = []
+    for author_id in resolved:
+        if isinstance(author_id, Exception):
+            logger.warning("Author lookup error: %s", author_id)
+            continue
+        if author_id:
+            author_ids.append(author_id)
     return author_ids
 
 
-@app.get("/health")
-async def health() -> Dict[str, str]:
-    return {"status": "ok"}
+@app.get("/health", response_class=Response)
+async def health() -> Response:
+    return _HEALTH_RESPONSE
 
 
 @app.get("/search")
 async def search_books(request: Request, q: str = Query(..., min_length=1), max_results: int = 10) -> Dict[str, Any]:
     _require_api_key(request)
-    _rate_limit(request)
+    await _rate_limit(request)
+    max_results = max(1, min(max_results, 20))
+    cache_key = (q.strip().lower(), max_results)
+    cached = _search_cache.get(cache_key)
+    if cached is not None:
+        return {"query": q, "results": cached}
+
     params = {
         "q": q,
-        "maxResults": max(1, min(max_results, 20))
+        "maxResults": max_results
     }
     if GOOGLE_BOOKS_API_KEY:
         params["key"] = GOOGLE_BOOKS_API_KEY
 
-    async with httpx.AsyncClient(timeout=10) as client:
-        response = await client.get(GOOGLE_BOOKS_URL, params=params)
+    client: httpx.AsyncClient = request.app.state.http
+    response = await client.get(GOOGLE_BOOKS_URL, params=params)
 
     if response.status_code != 200:
         logger.warning("Google Books error: %s %s", response.status_code, response.text)
         raise HTTPException(status_code=502, detail="Google Books API error")
 
-    payload = response.json()
+    payload = orjson.loads(response.content)
     items = payload.get("items", []) or []
-    results = [_normalize_google_book(item) for item in items]
+    normalize = _normalize_google_book
+    results = [normalize(item) for item in items]
+    _search_cache[cache_key] = results
     return {"query": q, "results": results}
 
 
 @app.post("/add")
 async def add_book(request: Request, payload: AddBookPayload) -> Dict[str, Any]:
     _require_api_key(request)
-    _rate_limit(request)
+    await _rate_limit(request)
     if not NOTION_TOKEN or not NOTION_DATABASE_ID:
         raise HTTPException(status_code=500, detail="Notion credentials not configured")
 
-    async with httpx.AsyncClient(timeout=10) as client:
-        schema = await _get_database_schema(client, NOTION_DATABASE_ID)
-        title_prop = await _get_database_title_property_name(client, NOTION_DATABASE_ID) or "Name"
-        page_payload = _build_book_page_payload(payload, schema, title_prop)
-        await _attach_author_relations(client, page_payload["properties"], payload.authors)
+    client: httpx.AsyncClient = request.app.state.http
+    # The book database schema and the author pages are independent, so resolve them together.
+    (schema, title_prop), author_ids = await asyncio.gather(
+        _get_database_meta(client, NOTION_DATABASE_ID),
+        _get_or_create_author_ids(client, payload.authors),
+    )
+    page_payload = _build_book_page_payload(payload, schema, title_prop or "Name")
+    _attach_author_relations(page_payload["properties"], author_ids)
 
-        notion_payload: Dict[str, Any] = {"parent": {"database_id": NOTION_DATABASE_ID}, **page_payload}
+    notion_payload: Dict[str, Any] = {"parent": {"database_id": NOTION_DATABASE_ID}, **page_payload}
 
-        response = await client.post(NOTION_PAGES_URL, json=notion_payload, headers=_notion_headers())
+    response = await _notion_request(
+        client, "POST", NOTION_PAGES_URL, content=orjson.dumps(notion_payload), headers=_notion_headers()
+    )
 
     if response.status_code >= 400:
         logger.warning("Notion API error: %s %s", response.status_code, response.text)
         raise HTTPException(status_code=502, detail="Notion API error")
 
-    return {"status": "added", "notion_id": response.json().get("id")}
+    return {"status": "added", "notion_id": orjson.loads(response.content).get("id")}